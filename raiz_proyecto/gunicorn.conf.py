@@ -0,0 +1,18 @@
+"""Gunicorn settings for production.
+Usage: gunicorn -c gunicorn.conf.py 'pagina_app.run:create_app()'
+"""
+import os
+
+# gevent workers monkey-patch sockets, so a request waiting on PostgreSQL
+# yields to other requests instead of blocking the whole worker. psycopg 3
+# waits on patched sockets and needs no extra patching (unlike psycopg2,
+# which would need psycogreen).
+worker_class = 'gevent'
+worker_connections = 1000
+workers = (os.cpu_count() or 1) * 2
+
+bind = os.environ.get('GUNICORN_BIND', '127.0.0.1:8000')
+
+# The project is not installed as a package (rye `virtual = true`), so make
+# `pagina_app` importable from src/ next to this file.
+pythonpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
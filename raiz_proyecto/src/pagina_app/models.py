@@ -4,18 +4,49 @@ All comments are intentionally in English to meet the project requirement.
 from __future__ import annotations
 
 from datetime import datetime
+from functools import partial
 from typing import Optional
 
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from slugify import slugify
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import validates
+
+try:  # gevent is an optional (production) dependency
+    from gevent import get_hub as gevent_get_hub
+    from gevent.monkey import is_module_patched as gevent_is_module_patched
+except ImportError:  # pragma: no cover - depends on the environment
+    gevent_get_hub = None
 
 # SQLAlchemy instance (initialized in run.py)
 db = SQLAlchemy()
 
+# Slug settings fixed once; 80 chars keeps URLs short and leaves room for suffixes.
+_slugify = partial(
+    slugify, max_length=80, lowercase=True, allow_unicode=False, separator='-'
+)
+
+# Description characters shown per task on the index page (passed to
+# index.html as `description_chars`; SQL fetches one extra for the ellipsis).
+INDEX_DESCRIPTION_CHARS = 180
+
+
+def run_password_hash(func, *args, **kwargs):
+    """Run a CPU-bound Werkzeug hashing call without stalling other requests.
+
+    Under monkey-patched gevent workers the call runs on gevent's native
+    thread pool, so the hub keeps serving other greenlets while hashlib does
+    the work with the GIL released. Otherwise it runs directly.
+    """
+    if gevent_get_hub is None or not gevent_is_module_patched('threading'):
+        return func(*args, **kwargs)
+    return gevent_get_hub().threadpool.spawn(func, *args, **kwargs).get()
+
 
 class User(UserMixin, db.Model):
     """Application user model."""
@@ -27,21 +58,41 @@ class User(UserMixin, db.Model):
     password_hash = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
+    # Case-insensitive uniqueness; also lets email lookups use an index scan.
+    __table_args__ = (
+        db.Index('ix_users_email_lower', db.func.lower(email), unique=True),
+    )
+
     # Relationship: one user -> many tasks
     tasks = db.relationship(
-        'Task', backref='owner', lazy=True, cascade='all, delete-orphan'
+        'Task', back_populates='owner', lazy='select', cascade='all, delete-orphan'
     )
 
     # Flask-Login requires a str id for cookies if custom; default works.
 
+    @staticmethod
+    def normalize_email(email: str) -> str:
+        """Return the canonical (trimmed, lowercase) form of an email address."""
+        return email.strip().lower()
+
+    @validates('email')
+    def _validate_email(self, key: str, email: str) -> str:  # noqa: ARG002
+        return User.normalize_email(email)
+
     # ----- Authentication helpers -----
+    @staticmethod
+    def hash_password(password: str) -> str:
+        """Return a Werkzeug hash of `password` using the configured method."""
+        method = current_app.config.get('PASSWORD_HASH_METHOD', 'scrypt')
+        return run_password_hash(generate_password_hash, password, method=method)
+
     def set_password(self, password: str) -> None:
         """Hash and store the password using Werkzeug."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = User.hash_password(password)
 
     def check_password(self, password: str) -> bool:
         """Verify the given password against the stored hash."""
-        return check_password_hash(self.password_hash, password)
+        return run_password_hash(check_password_hash, self.password_hash, password)
 
     # ----- Persistence helpers -----
     def save(self) -> None:
@@ -49,6 +100,32 @@ class User(UserMixin, db.Model):
         db.session.add(self)
         db.session.commit()
 
+    @classmethod
+    def create_if_new(cls, name: str, email: str, password: str) -> Optional['User']:
+        """Insert a user unless the email is taken, in a single statement.
+
+        Returns the new user, or None if the email is already registered.
+        Using ON CONFLICT also closes the race between two concurrent signups.
+        """
+        stmt = (
+            pg_insert(cls)
+            .values(
+                name=name,
+                email=cls.normalize_email(email),
+                password_hash=cls.hash_password(password),
+                created_at=datetime.utcnow(),
+            )
+            .on_conflict_do_nothing()
+            .returning(cls)
+        )
+        user = db.session.scalars(stmt).one_or_none()
+        if user is not None:
+            # Detach before committing so commit does not expire the RETURNING
+            # values; the caller can read user.id without a refresh SELECT.
+            db.session.expunge(user)
+        db.session.commit()
+        return user
+
     @staticmethod
     def get_by_id(user_id: int) -> Optional['User']:
         """Fetch a user by primary key."""
@@ -56,8 +133,26 @@ class User(UserMixin, db.Model):
 
     @staticmethod
     def get_by_email(email: str) -> Optional['User']:
-        """Fetch a user by email address."""
-        return User.query.filter_by(email=email).first()
+        """Fetch a user by email address (case-insensitive)."""
+        return db.session.execute(
+            _GET_USER_BY_EMAIL, {'email': User.normalize_email(email)}
+        ).scalar_one_or_none()
+
+
+def _next_free_slug(base: str, used: set[str]) -> str:
+    """Return `base`, or `base-N` with the smallest N >= 1 not in `used`."""
+    if base not in used:
+        return base
+    counter = 1
+    while f"{base}-{counter}" in used:
+        counter += 1
+    return f"{base}-{counter}"
+
+
+# Built once so SQLAlchemy's compiled-statement cache is hit on every login.
+_GET_USER_BY_EMAIL = db.select(User).where(
+    db.func.lower(User.email) == db.bindparam('email')
+)
 
 
 class Task(db.Model):
@@ -77,20 +172,62 @@ class Task(db.Model):
     slug = db.Column(db.String(255), unique=True, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
-    def _generate_unique_slug(self) -> str:
+    # Matches the listing order so pages are read straight off the index.
+    __table_args__ = (
+        db.Index('ix_tasks_created_at_desc', created_at.desc(), id.desc()),
+        # Lets the anchored slug-suffix regex lookup use an index under any collation.
+        db.Index(
+            'ix_tasks_slug_pattern', slug, postgresql_ops={'slug': 'varchar_pattern_ops'}
+        ),
+    )
+
+    # Relationship: many tasks -> one user (inverse of User.tasks).
+    # Lazy loads raise, so callers must eager-load owners (no accidental N+1).
+    owner = db.relationship('User', back_populates='tasks', lazy='raise_on_sql')
+
+    def _generate_unique_slug(self, reserved: Optional[set[str]] = None) -> str:
         """Generate a unique slug from the task title.
 
         If the base slug already exists, append an incrementing suffix: -1, -2, ...
+        Slugs in `reserved` (not yet in the database) are treated as taken too.
         """
-        base = slugify(self.title)
+        base = _slugify(self.title)
         if not base:
-            base = slugify(f"task-{self.id or ''}")
-        slug_candidate = base
-        counter = 1
-        while Task.query.filter_by(slug=slug_candidate).first() is not None:
-            slug_candidate = f"{base}-{counter}"
-            counter += 1
-        return slug_candidate
+            base = _slugify(f"task-{self.id or ''}")
+        # Fetch the base slug and its numbered variants (base-1, base-2, ...) in
+        # one query, then pick the first free suffix in Python instead of
+        # probing once per candidate. Slugs only contain [a-z0-9-], so `base`
+        # needs no regex escaping, and the anchored prefix can use the index.
+        used = set(
+            db.session.execute(
+                db.select(Task.slug).where(
+                    Task.slug.regexp_match(f"^{base}(-[0-9]+)?$")
+                )
+            ).scalars()
+        )
+        if reserved:
+            used |= reserved
+        return _next_free_slug(base, used)
+
+    @classmethod
+    def bulk_create(cls, rows: list[dict]) -> None:
+        """Insert many tasks with one SELECT and one multi-row INSERT.
+
+        Each dict holds Task column values (at least `user_id` and `title`).
+        Unique slugs are assigned in memory against the existing slugs instead
+        of probing the database once per task. Commits the session.
+        """
+        used = set(db.session.execute(db.select(cls.slug)).scalars())
+        values = []
+        for row in rows:
+            row = dict(row)
+            if not row.get('slug'):
+                row['slug'] = _next_free_slug(_slugify(row['title']) or 'task', used)
+            used.add(row['slug'])
+            values.append(row)
+        if values:
+            db.session.execute(db.insert(cls), values)
+        db.session.commit()
 
     def public_url(self) -> str:
         """Return the public URL path for this task."""
@@ -116,16 +253,64 @@ class Task(db.Model):
         return Task.query.filter_by(slug=slug).first()
 
     @staticmethod
-    def get_all():
-        """Return all tasks ordered by creation date descending."""
-        return Task.query.order_by(Task.created_at.desc()).all()
-
-
-# Optional: ensure slug before insert if missing.
-@event.listens_for(Task, 'before_insert')
-def task_before_insert(mapper, connection, target: Task):
-    if not target.slug:
-        # This will still go through save's logic when called explicitly,
-        # but for direct session.add/commit it guarantees a slug exists.
-        base = slugify(target.title) or 'task'
-        target.slug = base
+    def listing_version() -> tuple:
+        """Return a cheap fingerprint (newest timestamp, newest id) of the task list.
+
+        Both maxima are read off the end of an index, unlike COUNT(*), which
+        scans the whole table. Tasks are never edited or deleted individually,
+        so only inserts need to change the fingerprint.
+        """
+        return tuple(
+            db.session.execute(
+                db.select(db.func.max(Task.created_at), db.func.max(Task.id))
+            ).one()
+        )
+
+    @staticmethod
+    def _keyset_page(stmt, after: Optional[int], limit: int):
+        """Apply newest-first keyset pagination to a select over Task columns.
+
+        `after` is the id of the last task of the previous page; the next page
+        starts strictly after it in (created_at, id) order.
+        """
+        stmt = stmt.order_by(Task.created_at.desc(), Task.id.desc()).limit(limit)
+        if after is not None:
+            last_created_at = (
+                db.select(Task.created_at).where(Task.id == after).scalar_subquery()
+            )
+            stmt = stmt.where(
+                db.tuple_(Task.created_at, Task.id) < db.tuple_(last_created_at, after)
+            )
+        return stmt
+
+    @staticmethod
+    def list_rows_for_index(after: Optional[int] = None, limit: int = 50) -> list:
+        """Return one index page as lightweight rows instead of ORM objects.
+
+        Only the columns index.html reads are selected (the description is
+        cut down in SQL), so no Task instances or identity-map entries are
+        built. Rows expose the same attribute names the template uses.
+        """
+        stmt = db.select(
+            Task.id,
+            Task.slug,
+            Task.title,
+            Task.priority,
+            Task.due_date,
+            db.func.substr(Task.description, 1, INDEX_DESCRIPTION_CHARS + 1)
+            .label('description'),
+        )
+        return list(db.session.execute(Task._keyset_page(stmt, after, limit)))
+
+
+# Give Tasks added directly via session.add() a unique slug. Task.save sets
+# the slug itself, so this only does work for tasks that bypassed it.
+@event.listens_for(db.session, 'before_flush')
+def assign_missing_task_slugs(session, flush_context, instances):  # noqa: ARG001
+    # Slugs handed out in this flush are not in the database yet, so track
+    # them to keep two pending tasks with the same title apart.
+    assigned: set[str] = set()
+    for obj in session.new:
+        if isinstance(obj, Task) and not obj.slug:
+            obj.slug = obj._generate_unique_slug(reserved=assigned)
+            assigned.add(obj.slug)
@@ -0,0 +1,61 @@
+"""Shared pytest fixtures for the To-Do app.
+Tests need a disposable PostgreSQL database: set TEST_DATABASE_URL to its DSN.
+"""
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from pagina_app.models import db
+from pagina_app.run import create_app
+
+
+@pytest.fixture
+def app(monkeypatch):
+    """App bound to the test database, with fresh tables for each test."""
+    url = os.environ.get('TEST_DATABASE_URL')
+    if not url:
+        pytest.skip('TEST_DATABASE_URL is not set')
+    monkeypatch.setenv('DATABASE_URL', url)
+
+    app = create_app()
+    app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def assert_max_queries(app):
+    """Context manager failing the test if the block runs more than `n` queries.
+
+    Counts every statement sent through the engine via `before_cursor_execute`.
+    """
+    @contextmanager
+    def _assert_max_queries(n: int):
+        statements: list[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+        assert len(statements) <= n, (
+            f'expected at most {n} queries, got {len(statements)}:\n'
+            + '\n'.join(statements)
+        )
+
+    return _assert_max_queries
@@ -0,0 +1,38 @@
+"""Query-count regression tests for the public pages (guards against N+1)."""
+from __future__ import annotations
+
+from pagina_app.models import db, User, Task
+
+
+def _make_user() -> User:
+    user = User(name='Ada', email='ada@example.com', password_hash='x')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def test_index_query_count_is_constant(client, assert_max_queries):
+    user = _make_user()
+    Task.bulk_create([{'user_id': user.id, 'title': f'Task {i}'} for i in range(20)])
+
+    # Listing fingerprint + one projected page query, regardless of task count.
+    with assert_max_queries(2):
+        response = client.get('/')
+    assert response.status_code == 200
+    assert b'Task 19' in response.data
+
+
+def test_task_detail_query_count(client, assert_max_queries):
+    user = _make_user()
+    Task.bulk_create([{'user_id': user.id, 'title': 'Buy milk'}])
+
+    # A single lookup by slug; the detail page does not touch the owner.
+    with assert_max_queries(1):
+        response = client.get('/task/buy-milk/')
+    assert response.status_code == 200
+
+
+def test_missing_task_query_count(client, assert_max_queries):
+    with assert_max_queries(1):
+        response = client.get('/task/foo/')
+    assert response.status_code == 404